@@ -1,7 +1,7 @@
 import pygame
 import os
 import random
-import copy
+from collections import deque
 
 pygame.init()
 
@@ -25,71 +25,119 @@ CARD_WIDTH, CARD_HEIGHT = 90, 130
 # Deck ranks in ascending order
 DECK_ORDER = ['A','2','3','4','5','6','7','8','9','10','J','Q','K']
 
+# Card encoding: card = suit*16 + rank, so rank = card & 15 and
+# suit = card >> 4. Red and black suits alternate in SUITS, so two
+# cards are opposite colors exactly when the low suit bit differs.
+SUITS = 'HCDS'
+ACE, KING = 0, 12
+
+# Cap on undo snapshots kept in memory
+MAX_HISTORY = 64
+
 # Fonts
 font = pygame.font.SysFont(None, 24)
 big_font = pygame.font.SysFont(None, 28)
 
 def create_full_deck():
-    """Create a full 52-card deck, shuffled."""
-    suits = ['H','D','C','S']
-    values = ['A'] + [str(i) for i in range(2,11)] + ['J','Q','K']
-    deck = [f"{val}{suit}" for suit in suits for val in values]
+    """Create a full 52-card deck of int codes, shuffled."""
+    deck = [suit*16 + rank for suit in range(4) for rank in range(13)]
     random.shuffle(deck)
     return deck
 
+def card_name(card):
+    """'10H'-style name for an int card code (asset file stems)."""
+    return DECK_ORDER[card & 15] + SUITS[card >> 4]
+
 def load_card_images():
     """
-    Load images at their native resolution, then scale them to (CARD_WIDTH, CARD_HEIGHT).
+    Load images at their native resolution, then scale them to
+    (CARD_WIDTH, CARD_HEIGHT). Keyed by int card code plus "BACK".
     """
     images = {}
-    suits = ['H','D','C','S']
-    values = ['A'] + [str(i) for i in range(2,11)] + ['J','Q','K']
-
-    for suit in suits:
-        for val in values:
-            path = os.path.join("assets", f"{val}{suit}.png")
+    for suit in range(4):
+        for rank in range(13):
+            card = suit*16 + rank
+            path = os.path.join("assets", f"{card_name(card)}.png")
             img = pygame.image.load(path)
-            # Smooth-scale to avoid blockiness
+            # Smooth-scale to avoid blockiness, then match the display
+            # pixel format so blits don't convert per frame
             scaled = pygame.transform.smoothscale(img, (CARD_WIDTH, CARD_HEIGHT))
-            images[f"{val}{suit}"] = scaled
+            images[card] = scaled.convert_alpha()
 
     # Card back
     back_path = os.path.join("assets", "red_back.png")
     back_img = pygame.image.load(back_path)
     back_scaled = pygame.transform.smoothscale(back_img, (CARD_WIDTH, CARD_HEIGHT))
-    images["BACK"] = back_scaled
+    images["BACK"] = back_scaled.convert_alpha()
 
     return images
 
 card_images = load_card_images()
 
+def make_down_strips():
+    """
+    Pre-render the face-down stack for every possible depth (a pile
+    starts with at most 6 face-down cards), so draw blits one strip
+    instead of n mostly-occluded backs.
+    """
+    back = card_images["BACK"]
+    strips = [None]
+    for n in range(1, 7):
+        h = CARD_HEIGHT + (n - 1)*TABLEAU_SPACING
+        surf = pygame.Surface((CARD_WIDTH, h), pygame.SRCALPHA)
+        for k in range(n):
+            surf.blit(back, (0, k*TABLEAU_SPACING))
+        strips.append(surf.convert_alpha())
+    return strips
+
+down_strips = make_down_strips()
+
 def get_rank(card):
-    return card[:-1]
+    return card & 15
 
 def get_suit(card):
-    return card[-1]
+    return card >> 4
 
-def rank_index(r):
-    return DECK_ORDER.index(r)
+def card_hit(x, y, px, py):
+    """Point-in-card-rect test as plain comparisons; no Rect needed."""
+    return x <= px < x + CARD_WIDTH and y <= py < y + CARD_HEIGHT
 
 def is_opposite_color(c1, c2):
-    red_suits = ['H','D']
-    black_suits = ['C','S']
-    return ((get_suit(c1) in red_suits and get_suit(c2) in black_suits) or
-            (get_suit(c1) in black_suits and get_suit(c2) in red_suits))
+    # Colors differ exactly when the low suit bit (bit 4) differs
+    return (c1 ^ c2) & 16 != 0
+
+def _build_move_tables():
+    """
+    Enumerate every legal (target-top, moving-card) pair once at import.
+    The rule set is tiny — 52 cards against 53 possible targets — so the
+    validators collapse to a single set-membership test.
+    """
+    # Empty pile (target None) takes only Kings
+    tableau_ok = {(None, suit*16 + KING) for suit in range(4)}
+    for t_suit in range(4):
+        for t_rank in range(1, 13):
+            target = t_suit*16 + t_rank
+            for m_suit in range(4):
+                if (t_suit ^ m_suit) & 1:  # opposite colors only
+                    tableau_ok.add((target, m_suit*16 + t_rank - 1))
+
+    # Per suit: Ace on empty, then each rank on its predecessor
+    foundation_ok = []
+    for suit in range(4):
+        pairs = {(None, suit*16 + ACE)}
+        for rank in range(1, 13):
+            pairs.add((suit*16 + rank - 1, suit*16 + rank))
+        foundation_ok.append(frozenset(pairs))
+    return frozenset(tableau_ok), foundation_ok
+
+TABLEAU_OK, FOUNDATION_OK = _build_move_tables()
 
 def is_valid_tableau_move(target_up, top_card):
     """
     - If the tableau pile is empty, only a King can move there.
     - Otherwise, top_card must be exactly one rank lower + opposite color.
     """
-    if not target_up:
-        return get_rank(top_card) == 'K'
-    target_top = target_up[-1]
-    return (
-        rank_index(get_rank(top_card)) + 1 == rank_index(get_rank(target_top))
-        and is_opposite_color(top_card, target_top)
-    )
+    return (target_up[-1] if target_up else None, top_card) in TABLEAU_OK
 
 def is_valid_foundation_move(foundation_cards, card, suit):
     """
@@ -97,44 +145,53 @@ def is_valid_foundation_move(foundation_cards, card, suit):
     - If empty, must place Ace of that suit.
     - Otherwise must place next higher rank in ascending order.
     """
-    if get_suit(card) != suit:
-        return False
-    if not foundation_cards:
-        return get_rank(card) == 'A'
-    top = foundation_cards[-1]
-    return rank_index(get_rank(card)) == rank_index(get_rank(top)) + 1
+    return (foundation_cards[-1] if foundation_cards else None, card) in FOUNDATION_OK[suit]
 
 class Solitaire:
     def __init__(self):
-        self.deck = create_full_deck()
-
-        # Tableau: each with 'down' (face-down) and 'up' (face-up) lists
-        self.tableau = [{"down": [], "up": []} for _ in range(7)]
-        self.setup_tableau()  # 28 cards dealt
-
-        # Remainder (24 cards) is our stock
-        self.stock = self.deck[:]
-        self.waste = []
-        self.spent = []  # older waste cards that aren’t currently displayed
-
-        # Foundations, labeled suits in order
-        self.foundation_suits = ['H','D','C','S']
+        deck = create_full_deck()
+
+        # Tableau: parallel arrays of face-down and face-up lists, one
+        # entry per pile, so pile access is a single subscript
+        self.tableau_down = [[] for _ in range(7)]
+        self.tableau_up = [[] for _ in range(7)]
+        self.setup_tableau(deck)  # 28 cards dealt
+
+        # Remainder (24 cards) is our stock; deques give O(1) pops at
+        # both ends (click_stock retires the oldest waste card)
+        self.stock = deque(deck)
+        self.waste = deque()
+        self.spent = deque()  # older waste cards that aren’t currently displayed
+
+        # Foundations, labeled suits in H/D/C/S display order (int codes)
+        self.foundation_suits = [SUITS.index(s) for s in 'HDCS']
         self.foundations = [[] for _ in range(4)]
         self.foundation_rects = []
         for i in range(4):
             fx = WIDTH - (CARD_WIDTH + 20)
             fy = 20 + i*(CARD_HEIGHT + 15)
             self.foundation_rects.append(pygame.Rect(fx, fy, CARD_WIDTH, CARD_HEIGHT))
+        self.foundation_xy = [(r.x, r.y) for r in self.foundation_rects]
 
-        # Drag state: (source, subpile, origin_index, dx, dy)
+        # Fixed column X for each tableau pile
+        self.pile_x = [TABLEAU_START_X + i*(CARD_WIDTH+10) for i in range(7)]
+
+        # Drag state: (source, subpile, origin_index, dx, dy), plus the
+        # subpile pre-composed onto one surface so draw does a single blit.
+        # The slot and subpile list are reused across drags instead of
+        # allocating fresh containers on every pickup.
         self.dragging = None
+        self.drag_surface = None
+        self._drag_slot = [None]*5
+        self._subpile = []
+        self._cursor_is_hand = False
 
         # Moves and timer
         self.move_count = 0
         self.start_time = pygame.time.get_ticks()
 
-        # History (for undo)
-        self.history = []
+        # History (for undo); deque drops the oldest snapshot past the cap
+        self.history = deque(maxlen=MAX_HISTORY)
 
         # Buttons
         self.undo_rect = pygame.Rect(10, HEIGHT - 40, UNDO_BTN_WIDTH, UNDO_BTN_HEIGHT)
@@ -145,48 +202,125 @@ class Solitaire:
             RESHUFFLE_BTN_HEIGHT
         )
 
+        # Repaint flag: set by input handlers, cleared by draw. The main
+        # loop skips drawing entirely while nothing on screen changes.
+        self.dirty = True
+
         # Game over
         self.game_over = False
         self.play_again_rect = pygame.Rect(WIDTH // 2 - 60, HEIGHT // 2 + 50, 120, 40)
 
-    def setup_tableau(self):
+        # Pre-rendered labels (static text never changes, so render once)
+        self.undo_label = font.render("Undo", True, (255,255,255))
+        self.reshuffle_label = font.render("Reshuffle", True, (255,255,255))
+        self.suit_labels = [font.render(SUITS[s], True, (255,255,255)) for s in self.foundation_suits]
+        self.win_label = big_font.render("YOU WIN!", True, (255,255,0))
+        self.play_again_label = font.render("Play Again", True, (255,255,255))
+
+        # Timer/moves line is re-rendered only when the second ticks over
+        self._cached_sec = -1
+        self._cached_moves = -1
+        self._cached_hud = None
+
+        # Static backdrop: felt, foundation outlines + suit labels, buttons.
+        # None of these pixels ever change, so compose them once.
+        self.background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.background.fill((0,128,0))
+        for i, rect in enumerate(self.foundation_rects):
+            pygame.draw.rect(self.background, (255,255,255), rect, 2)
+            label = self.suit_labels[i]
+            self.background.blit(label, label.get_rect(center=rect.center))
+        pygame.draw.rect(self.background, (200,50,50), self.undo_rect)
+        self.background.blit(self.undo_label,
+                             self.undo_label.get_rect(center=self.undo_rect.center))
+        pygame.draw.rect(self.background, (50,50,200), self.reshuffle_rect)
+        self.background.blit(self.reshuffle_label,
+                             self.reshuffle_label.get_rect(center=self.reshuffle_rect.center))
+
+    def setup_tableau(self, deck):
         """
         Deal i+1 cards onto each of the 7 piles, i facedown + 1 faceup.
-        Removes exactly 28 cards from self.deck.
+        Pops exactly 28 cards off the end of deck, leaving the stock.
         """
-        used = 0
         for i in range(7):
             for j in range(i + 1):
                 if j < i:
-                    self.tableau[i]["down"].append(self.deck[used])
+                    self.tableau_down[i].append(deck.pop())
                 else:
-                    self.tableau[i]["up"].append(self.deck[used])
-                used += 1
-        self.deck = self.deck[28:]  # remove those 28 from the deck
+                    self.tableau_up[i].append(deck.pop())
 
     def save_state(self):
-        """Save a deep copy of the current state for undo."""
-        return {
-            "tableau": copy.deepcopy(self.tableau),
-            "stock": copy.deepcopy(self.stock),
-            "waste": copy.deepcopy(self.waste),
-            "spent": copy.deepcopy(self.spent),
-            "foundations": copy.deepcopy(self.foundations),
-            "move_count": self.move_count,
-            "game_over": self.game_over
-        }
+        """
+        Save the current state for undo as a flat tuple of tuples.
+        Cards are immutable int codes, so the snapshot shares them; the
+        tuples themselves are immutable and never need a defensive copy.
+        """
+        return (
+            tuple(self.stock),
+            tuple(self.waste),
+            tuple(self.spent),
+            tuple(zip(map(tuple, self.tableau_down), map(tuple, self.tableau_up))),
+            tuple(tuple(f) for f in self.foundations),
+            self.move_count,
+            self.game_over
+        )
 
     def load_state(self, state):
         """Load previously saved state."""
-        self.tableau = copy.deepcopy(state["tableau"])
-        self.stock = copy.deepcopy(state["stock"])
-        self.waste = copy.deepcopy(state["waste"])
-        self.spent = copy.deepcopy(state["spent"])
-        self.foundations = copy.deepcopy(state["foundations"])
-        self.move_count = state["move_count"]
-        self.game_over = state["game_over"]
+        stock, waste, spent, tableau, foundations, move_count, game_over = state
+        self.stock = deque(stock)
+        self.waste = deque(waste)
+        self.spent = deque(spent)
+        self.tableau_down = [list(d) for d, _ in tableau]
+        self.tableau_up = [list(u) for _, u in tableau]
+        self.foundations = [list(f) for f in foundations]
+        self.move_count = move_count
+        self.game_over = game_over
+
+    def pile_at(self, px):
+        """
+        Tableau column under x-coordinate px, or None if px misses every
+        column (left of the tableau, past pile 7, or in a gap).
+        """
+        i = (px - TABLEAU_START_X) // (CARD_WIDTH + 10)
+        if 0 <= i < 7 and px - self.pile_x[i] < CARD_WIDTH:
+            return i
+        return None
+
+    def make_drag_surface(self, subpile):
+        """
+        Compose the picked-up subpile onto one surface. The subpile never
+        changes mid-drag, so this is built once per pickup.
+        """
+        h = CARD_HEIGHT + (len(subpile) - 1)*TABLEAU_SPACING
+        surf = pygame.Surface((CARD_WIDTH, h), pygame.SRCALPHA).convert_alpha()
+        for k, c in enumerate(subpile):
+            surf.blit(card_images[c], (0, k*TABLEAU_SPACING))
+        return surf
+
+    def begin_drag(self, source, subpile, origin_index, dx, dy):
+        """Start a drag, rewriting the pooled slot in place."""
+        slot = self._drag_slot
+        slot[0] = source
+        slot[1] = subpile
+        slot[2] = origin_index
+        slot[3] = dx
+        slot[4] = dy
+        self.dragging = slot
+        self.drag_surface = self.make_drag_surface(subpile)
+
+    def end_drag(self):
+        """Release the drag, recycling the slot and subpile list."""
+        self._subpile.clear()
+        self._drag_slot[1] = None
+        self.dragging = None
+        self.drag_surface = None
 
     def handle_mouse_down(self, pos):
+        # A click may mutate state anywhere below; one spurious repaint
+        # on a miss is cheaper than flagging every mutation site
+        self.dirty = True
+
         # If the game is won, only check for Play Again
         if self.game_over:
             if self.play_again_rect.collidepoint(pos):
@@ -204,8 +338,7 @@ class Solitaire:
             return
 
         # Check stock
-        stock_rect = pygame.Rect(STOCK_X, STOCK_Y, CARD_WIDTH, CARD_HEIGHT)
-        if stock_rect.collidepoint(pos):
+        if card_hit(STOCK_X, STOCK_Y, pos[0], pos[1]):
             self.history.append(self.save_state())  # for undo
             self.click_stock()
             self.move_count += 1
@@ -216,36 +349,40 @@ class Solitaire:
         if self.waste:
             wx = WASTE_X
             wy = WASTE_Y + (len(self.waste) - 1)*TABLEAU_SPACING
-            if pygame.Rect(wx, wy, CARD_WIDTH, CARD_HEIGHT).collidepoint(pos):
+            if card_hit(wx, wy, pos[0], pos[1]):
                 self.history.append(self.save_state())
-                card = self.waste.pop()
-                subpile = [card]
-                dx = pos[0] - wx
-                dy = pos[1] - wy
-                self.dragging = ('waste', subpile, None, dx, dy)
+                subpile = self._subpile
+                subpile.append(self.waste.pop())
+                self.begin_drag('waste', subpile, None, pos[0] - wx, pos[1] - wy)
                 return
 
-        # Check tableau
-        for i, pile in enumerate(self.tableau):
-            x = TABLEAU_START_X + i*(CARD_WIDTH+10)
-            y = TABLEAU_START_Y + len(pile["down"])*TABLEAU_SPACING
-
-            for cindex in range(len(pile["up"]) - 1, -1, -1):
-                card_rect = pygame.Rect(x, y + cindex*TABLEAU_SPACING, CARD_WIDTH, CARD_HEIGHT)
-                if card_rect.collidepoint(pos):
+        # Check tableau: columns are on a fixed pitch, so the pile index
+        # and clicked card index fall out of integer arithmetic
+        i = self.pile_at(pos[0])
+        if i is not None:
+            up = self.tableau_up[i]
+            x = self.pile_x[i]
+            y = TABLEAU_START_Y + len(self.tableau_down[i])*TABLEAU_SPACING
+            if up:
+                rel_y = pos[1] - y
+                top_index = len(up) - 1
+                if 0 <= rel_y < top_index*TABLEAU_SPACING + CARD_HEIGHT:
+                    cindex = min(rel_y // TABLEAU_SPACING, top_index)
                     self.history.append(self.save_state())
-                    subpile = pile["up"][cindex:]
-                    del pile["up"][cindex:]
-                    dx = pos[0] - card_rect.x
-                    dy = pos[1] - card_rect.y
-                    self.dragging = ('tableau', subpile, i, dx, dy)
+                    subpile = self._subpile
+                    subpile.extend(up[cindex:])
+                    del up[cindex:]
+                    dx = pos[0] - x
+                    dy = pos[1] - (y + cindex*TABLEAU_SPACING)
+                    self.begin_drag('tableau', subpile, i, dx, dy)
                     return
 
     def click_stock(self):
         # If stock empty, recycle everything from waste + spent
         if not self.stock:
             if self.waste or self.spent:
-                self.stock = list(reversed(self.spent + self.waste))
+                self.stock.extend(reversed(self.waste))
+                self.stock.extend(reversed(self.spent))
                 self.waste.clear()
                 self.spent.clear()
             return
@@ -253,51 +390,58 @@ class Solitaire:
         card = self.stock.pop()
         # If waste is at capacity 3, move oldest to spent
         if len(self.waste) == 3:
-            oldest = self.waste.pop(0)
+            oldest = self.waste.popleft()
             self.spent.append(oldest)
         self.waste.append(card)
 
     def handle_mouse_up(self, pos):
+        if self._cursor_is_hand:
+            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            self._cursor_is_hand = False
+
         if not self.dragging:
             return
 
+        self.dirty = True
         source, subpile, origin_index, dx, dy = self.dragging
         top_card = subpile[0]
 
-        # Attempt foundation drop if single card
+        # Attempt foundation drop if single card. The foundations are a
+        # vertical strip on a fixed pitch, so the slot index is arithmetic
         if len(subpile) == 1:
-            for i, rect in enumerate(self.foundation_rects):
-                if rect.collidepoint(pos):
+            fx = WIDTH - (CARD_WIDTH + 20)
+            if fx <= pos[0] < fx + CARD_WIDTH:
+                i = (pos[1] - 20) // (CARD_HEIGHT + 15)
+                if 0 <= i < 4 and card_hit(fx, 20 + i*(CARD_HEIGHT + 15), pos[0], pos[1]):
                     if is_valid_foundation_move(self.foundations[i], top_card, self.foundation_suits[i]):
                         self.foundations[i].append(top_card)
-                        self.dragging = None
                         self.on_drop_success(source, subpile, origin_index)
+                        self.end_drag()
                         return
 
-        # Attempt tableau drop
+        # Attempt tableau drop (same column arithmetic as the pickup)
         placed = False
-        for i, pile in enumerate(self.tableau):
-            x = TABLEAU_START_X + i*(CARD_WIDTH+10)
-            y = TABLEAU_START_Y + (len(pile["down"]) + len(pile["up"]))*TABLEAU_SPACING
-            drop_rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
-            if drop_rect.collidepoint(pos):
-                if is_valid_tableau_move(pile["up"], top_card):
-                    pile["up"].extend(subpile)
+        i = self.pile_at(pos[0])
+        if i is not None:
+            up = self.tableau_up[i]
+            y = TABLEAU_START_Y + (len(self.tableau_down[i]) + len(up))*TABLEAU_SPACING
+            if y <= pos[1] < y + CARD_HEIGHT:
+                if is_valid_tableau_move(up, top_card):
+                    up.extend(subpile)
                     placed = True
-                break
 
         if placed:
             self.on_drop_success(source, subpile, origin_index)
         else:
             self.on_drop_fail(source, subpile, origin_index)
 
-        self.dragging = None
+        self.end_drag()
 
     def on_drop_success(self, source, subpile, origin_index):
         # If from tableau, check flipping next face-down if needed
         if source == 'tableau':
-            up_cards = self.tableau[origin_index]["up"]
-            down_cards = self.tableau[origin_index]["down"]
+            up_cards = self.tableau_up[origin_index]
+            down_cards = self.tableau_down[origin_index]
             if not up_cards and down_cards:
                 up_cards.append(down_cards.pop())
 
@@ -308,17 +452,20 @@ class Solitaire:
         if source == 'waste':
             self.waste.extend(subpile)
         else:  # 'tableau'
-            self.tableau[origin_index]["up"].extend(subpile)
+            self.tableau_up[origin_index].extend(subpile)
 
     def handle_mouse_motion(self, pos):
-        if self.dragging:
+        # Only touch the OS cursor when its state actually changes
+        if self.dragging and not self._cursor_is_hand:
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            self._cursor_is_hand = True
 
     def handle_undo(self):
         if self.history:
             prev_state = self.history.pop()
             self.load_state(prev_state)
             self.move_count = max(0, self.move_count - 1)
+            self.dirty = True
 
     def check_for_win(self):
         # If all 52 cards are in the foundations, we win
@@ -327,11 +474,12 @@ class Solitaire:
             self.game_over = True
 
     def draw(self, screen):
+        self.dirty = False
         if self.game_over:
             self.draw_win_screen(screen)
             return
 
-        screen.fill((0,128,0))
+        screen.blit(self.background, (0, 0))
 
         # Stock
         if self.stock:
@@ -343,66 +491,46 @@ class Solitaire:
             wy = WASTE_Y + i*TABLEAU_SPACING
             screen.blit(card_images[card], (wx, wy))
 
-        # Foundations
-        for i, rect in enumerate(self.foundation_rects):
-            pygame.draw.rect(screen, (255,255,255), rect, 2)
-            suit_label = font.render(self.foundation_suits[i], True, (255,255,255))
-            label_rect = suit_label.get_rect(center=rect.center)
-            screen.blit(suit_label, label_rect)
-
+        # Foundations (outlines/labels live on the background)
+        for i in range(4):
             if self.foundations[i]:
                 top_card = self.foundations[i][-1]
-                screen.blit(card_images[top_card], (rect.x, rect.y))
+                screen.blit(card_images[top_card], self.foundation_xy[i])
 
         # Tableau
-        for i, pile in enumerate(self.tableau):
-            x = TABLEAU_START_X + i*(CARD_WIDTH+10)
+        for i in range(7):
+            x = self.pile_x[i]
             y = TABLEAU_START_Y
 
-            # facedown
-            for _ in pile["down"]:
-                screen.blit(card_images["BACK"], (x, y))
-                y += TABLEAU_SPACING
+            # facedown: one pre-rendered strip per stack depth
+            n = len(self.tableau_down[i])
+            if n:
+                screen.blit(down_strips[n], (x, y))
+                y += n*TABLEAU_SPACING
 
             # faceup
-            for c in pile["up"]:
+            for c in self.tableau_up[i]:
                 screen.blit(card_images[c], (x, y))
                 y += TABLEAU_SPACING
 
-        # Dragging subpile
+        # Dragging subpile: one pre-composed strip
         if self.dragging:
-            _, subpile, _, dx, dy = self.dragging
+            _, _, _, dx, dy = self.dragging
             mx, my = pygame.mouse.get_pos()
-            draw_x = mx - dx
-            draw_y = my - dy
-            for c in subpile:
-                screen.blit(card_images[c], (draw_x, draw_y))
-                draw_y += TABLEAU_SPACING
+            screen.blit(self.drag_surface, (mx - dx, my - dy))
 
         # Timer & moves at bottom center
         elapsed_ms = pygame.time.get_ticks() - self.start_time
         elapsed_sec = elapsed_ms // 1000
-        minutes = elapsed_sec // 60
-        seconds = elapsed_sec % 60
-        time_text = f"{minutes}:{seconds:02d}"
-        moves_text = f"Moves: {self.move_count}"
-        display_text = f"{time_text}   |   {moves_text}"
-
-        rendered_bottom = big_font.render(display_text, True, (255,255,255))
-        bottom_rect = rendered_bottom.get_rect(midbottom=(WIDTH//2, HEIGHT-5))
-        screen.blit(rendered_bottom, bottom_rect)
-
-        # Undo button
-        pygame.draw.rect(screen, (200,50,50), self.undo_rect)
-        undo_label = font.render("Undo", True, (255,255,255))
-        label_rect = undo_label.get_rect(center=self.undo_rect.center)
-        screen.blit(undo_label, label_rect)
-
-        # Reshuffle button
-        pygame.draw.rect(screen, (50,50,200), self.reshuffle_rect)
-        reshuffle_label = font.render("Reshuffle", True, (255,255,255))
-        label_rect2 = reshuffle_label.get_rect(center=self.reshuffle_rect.center)
-        screen.blit(reshuffle_label, label_rect2)
+        if elapsed_sec != self._cached_sec or self.move_count != self._cached_moves:
+            minutes = elapsed_sec // 60
+            seconds = elapsed_sec % 60
+            display_text = f"{minutes}:{seconds:02d}   |   Moves: {self.move_count}"
+            self._cached_hud = big_font.render(display_text, True, (255,255,255))
+            self._cached_sec = elapsed_sec
+            self._cached_moves = self.move_count
+        bottom_rect = self._cached_hud.get_rect(midbottom=(WIDTH//2, HEIGHT-5))
+        screen.blit(self._cached_hud, bottom_rect)
 
         pygame.display.flip()
 
@@ -410,15 +538,13 @@ class Solitaire:
         screen.fill((0,100,0))
 
         # Win text
-        win_text = big_font.render("YOU WIN!", True, (255,255,0))
-        win_rect = win_text.get_rect(center=(WIDTH//2, HEIGHT//2 - 20))
-        screen.blit(win_text, win_rect)
+        win_rect = self.win_label.get_rect(center=(WIDTH//2, HEIGHT//2 - 20))
+        screen.blit(self.win_label, win_rect)
 
         # Play again
         pygame.draw.rect(screen, (0,150,0), self.play_again_rect)
-        pa_label = font.render("Play Again", True, (255,255,255))
-        pa_rect = pa_label.get_rect(center=self.play_again_rect.center)
-        screen.blit(pa_label, pa_rect)
+        pa_rect = self.play_again_label.get_rect(center=self.play_again_rect.center)
+        screen.blit(self.play_again_label, pa_rect)
 
         pygame.display.flip()
 
@@ -426,7 +552,18 @@ def main():
     game = Solitaire()
     running = True
     while running:
-        for event in pygame.event.get():
+        if game.dragging:
+            # A drag tracks the mouse, so poll and repaint at 60 FPS
+            events = pygame.event.get()
+        else:
+            # Idle: sleep until input arrives or the next timer repaint
+            # is due instead of spinning the polling loop
+            first = pygame.event.wait(250)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -436,8 +573,14 @@ def main():
             elif event.type == pygame.MOUSEMOTION:
                 game.handle_mouse_motion(event.pos)
 
-        game.draw(screen)
-        clock.tick(60)
+        # Repaint only when state changed, a drag is tracking the mouse,
+        # or the timer's seconds digit ticked over
+        elapsed_sec = (pygame.time.get_ticks() - game.start_time) // 1000
+        if (game.dirty or game.dragging
+                or (not game.game_over and elapsed_sec != game._cached_sec)):
+            game.draw(screen)
+        if game.dragging:
+            clock.tick(60)
     pygame.quit()
 
 if __name__ == '__main__':